@@ -1,16 +1,129 @@
 """Google Drive API v3 client."""
 
-from typing import List, Optional
+from typing import Dict, Iterator, List, Optional
+from collections import OrderedDict
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from datetime import datetime, timezone
+from functools import partial
+from itertools import islice
 from googleapiclient.discovery import build
-from googleapiclient.http import MediaIoBaseDownload
+from googleapiclient.errors import HttpError
+from googleapiclient.http import build_http
+from googleapiclient.model import JsonModel
+import google_auth_httplib2
 import io
-from datetime import datetime
+import json
+import os
+import random
+import sys
+import tempfile
+import threading
+import time
+import weakref
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
 from .models import DriveItem, ItemType
 
 import logging
 logger = logging.getLogger(__name__)
 
+# Number of worker threads for concurrent requests (folder listings, chunked
+# searches, download ranges). Workers are kept for the life of the client, along
+# with their HTTP connections.
+MAX_WORKERS = 16
+
+# Maximum number of folder IDs OR'ed together in a single query
+MAX_PARENTS_PER_QUERY = 50
+
+# Files are downloaded as concurrent byte ranges of this size
+DOWNLOAD_PART_SIZE = 16 * 1024 * 1024
+
+# Maximum number of sub-requests Drive accepts in a single batch request
+MAX_BATCH_SIZE = 100
+
+# Rate-limited batch sub-requests are retried this many times, with exponential
+# backoff starting at RATE_LIMIT_BACKOFF seconds
+MAX_RATE_LIMIT_RETRIES = 5
+RATE_LIMIT_BACKOFF = 1.0
+
+# Reasons Drive gives for 403 responses that are rate limits, not permission errors
+RATE_LIMIT_REASONS = {'rateLimitExceeded', 'userRateLimitExceeded'}
+
+# Default number of seconds folder listings are cached for
+LISTING_CACHE_TTL = 60.0
+
+# Maximum number of cached folder listings, least recently used ones are evicted first
+LISTING_CACHE_SIZE = 1024
+
+FOLDER_MIME_TYPE = 'application/vnd.google-apps.folder'
+
+# File fields read by DriveItem.update_from_api
+ITEM_FIELDS = 'id, name, createdTime, modifiedTime, mimeType, owners(emailAddress), capabilities(canEdit, canComment, canView), appProperties, properties'
+
+# File fields for listings that don't need owners, permissions or properties
+LEAN_ITEM_FIELDS = 'id, name, mimeType, modifiedTime'
+
+# Escapes for string literals in Drive queries
+_ESCAPE_TABLE = str.maketrans({"'": "\\'", "\\": "\\\\"})
+
+# Fields of a comments().list response read by get_comments
+COMMENT_FIELDS = 'nextPageToken, comments(id, content, author(displayName, emailAddress), createdTime, modifiedTime, quotedFileContent, replies(id, content, author(displayName, emailAddress), createdTime, modifiedTime), resolved, anchor)'
+
+
+class _OrjsonModel(JsonModel):
+    """JsonModel that decodes API responses with orjson."""
+    
+    def deserialize(self, content):
+        try:
+            body = orjson.loads(content)
+        except orjson.JSONDecodeError:
+            # Not JSON, let JsonModel return the raw content
+            return super().deserialize(content)
+        if self._data_wrapper and isinstance(body, dict) and 'data' in body:
+            body = body['data']
+        return body
+
+
+def _format_timestamp(timestamp: str) -> str:
+    """Format a Drive API RFC 3339 timestamp (e.g. 2024-01-31T12:34:56.789Z) as YYYY-MM-DD HH:MM."""
+    # The date and time fields sit at fixed offsets, no need to parse
+    return f"{timestamp[:10]} {timestamp[11:16]}"
+
+
+_EPOCH = datetime(1970, 1, 1, tzinfo=timezone.utc)
+
+
+def _timestamp_ns(timestamp: Optional[str]) -> Optional[int]:
+    """Convert a Drive API RFC 3339 timestamp to integer nanoseconds since the epoch (None if missing or invalid)."""
+    if not timestamp:
+        return None
+    try:
+        # fromisoformat() only accepts a trailing 'Z' from Python 3.11
+        delta = datetime.fromisoformat(timestamp.replace('Z', '+00:00')) - _EPOCH
+    except ValueError:
+        return None
+    # Integer arithmetic, a float timestamp would lose the sub-microsecond digits
+    return (delta.days * 86400 + delta.seconds) * 1_000_000_000 + delta.microseconds * 1000
+
+
+def _is_rate_limited(error: Exception) -> bool:
+    """Check whether an error is a Drive rate limit (429, or 403 with a rate limit reason)."""
+    if not isinstance(error, HttpError):
+        return False
+    if error.resp.status == 429:
+        return True
+    if error.resp.status != 403:
+        return False
+    try:
+        errors = json.loads(error.content)['error']['errors']
+        return any(e.get('reason') in RATE_LIMIT_REASONS for e in errors)
+    except (ValueError, KeyError, TypeError, AttributeError):
+        return False
+
 
 class DriveClient:
     """
@@ -19,19 +132,51 @@ class DriveClient:
     Handles Drive operations: listing, searching, downloading, comments, properties, labels.
     """
     
-    def __init__(self, credentials):
+    def __init__(self, credentials, cache_ttl: float = LISTING_CACHE_TTL):
         """
         Initialize the Drive API client.
         
         Args:
             credentials: Google OAuth2 credentials object with get_credentials() method
                         or a Credentials object directly
+            cache_ttl: Seconds to cache folder listings for (list_items and the folder
+                       tree walked by folder-restricted searches). 0 disables caching.
+                       At most LISTING_CACHE_SIZE listings are kept.
         """
         # Support both OAuth2Client objects and raw Credentials
         if hasattr(credentials, 'get_credentials'):
-            self.service = build('drive', 'v3', credentials=credentials.get_credentials())
-        else:
-            self.service = build('drive', 'v3', credentials=credentials)
+            credentials = credentials.get_credentials()
+        self._credentials = credentials
+        # Use the discovery document bundled with googleapiclient: no discovery
+        # round-trip, and no discovery cache lookup. Decode responses with orjson
+        # when it is installed.
+        self.service = build(
+            'drive', 'v3',
+            credentials=credentials,
+            static_discovery=True,
+            cache_discovery=False,
+            model=_OrjsonModel() if orjson is not None else None
+        )
+        
+        # httplib2 is not thread-safe, so each thread gets its own transport. Live ones
+        # are also tracked here so close() can release their connections; a thread's
+        # transport drops out of the set when the thread exits.
+        self._local = threading.local()
+        self._transports = weakref.WeakSet()
+        self._transports_lock = threading.Lock()
+        
+        # Long-lived worker threads reuse their transport's keep-alive connections
+        # across calls. Page prefetches get their own pool: they are submitted from
+        # workers of the first pool, which then wait for them.
+        self._executor = ThreadPoolExecutor(max_workers=MAX_WORKERS, thread_name_prefix='drive')
+        self._prefetch_executor = ThreadPoolExecutor(max_workers=MAX_WORKERS, thread_name_prefix='drive-prefetch')
+        
+        # Cached folder listings: key -> (expiry time, cache generation, value), in
+        # least to most recently used order. Workers share it, hence the lock.
+        self._cache_ttl = cache_ttl
+        self._listing_cache = OrderedDict()
+        self._cache_lock = threading.Lock()
+        self._cache_generation = 0
         
         # Lazy-loaded user info and drives
         self._user_id = None
@@ -74,6 +219,69 @@ class DriveClient:
             self._drives = self.get_drives_info()
         return self._drives
 
+    def _http(self) -> google_auth_httplib2.AuthorizedHttp:
+        """Get the authorized HTTP transport for the current thread."""
+        http = getattr(self._local, 'http', None)
+        if http is None:
+            # build_http() matches googleapiclient's own transport: default timeout, no 308 redirects
+            http = google_auth_httplib2.AuthorizedHttp(self._credentials, http=build_http())
+            self._local.http = http
+            with self._transports_lock:
+                self._transports.add(http)
+        return http
+
+    def close(self):
+        """
+        Shut down worker threads and close all HTTP connections.
+        
+        The client must not be used after it is closed.
+        """
+        # Workers wait on prefetches, so stop them before the prefetch pool
+        self._executor.shutdown(wait=True, cancel_futures=True)
+        self._prefetch_executor.shutdown(wait=True, cancel_futures=True)
+        with self._transports_lock:
+            transports, self._transports = list(self._transports), weakref.WeakSet()
+        for http in transports:
+            http.close()
+        self.service.close()
+
+    def __enter__(self) -> 'DriveClient':
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def _cache_get(self, key: tuple):
+        """Get a cached listing, or None if it is missing, expired or invalidated."""
+        with self._cache_lock:
+            entry = self._listing_cache.get(key)
+            if entry is None:
+                return None
+            expires_at, generation, value = entry
+            if generation != self._cache_generation or expires_at <= time.monotonic():
+                del self._listing_cache[key]
+                return None
+            self._listing_cache.move_to_end(key)
+            return value
+    
+    def _cache_put(self, key: tuple, value, generation: int):
+        """Cache a listing fetched while the cache was at the given generation."""
+        if self._cache_ttl <= 0:
+            return
+        with self._cache_lock:
+            if generation != self._cache_generation:
+                return
+            self._listing_cache[key] = (time.monotonic() + self._cache_ttl, generation, value)
+            self._listing_cache.move_to_end(key)
+            while len(self._listing_cache) > LISTING_CACHE_SIZE:
+                self._listing_cache.popitem(last=False)
+    
+    def clear_cache(self):
+        """Drop all cached folder listings."""
+        with self._cache_lock:
+            self._cache_generation += 1
+            self._listing_cache.clear()
+
     def get_user_info(self) -> dict:
         """Get current user information."""
         return {
@@ -97,11 +305,21 @@ class DriveClient:
         root_drive.populate(name='My Drive')
         drives.append(root_drive)
         
-        # List all Shared Drives
+        # List all Shared Drives (API max page size is 100)
         try:
-            shared_drives = self.service.drives().list().execute()
-            for drive in shared_drives.get('drives', []):
-                drives.append(DriveItem(id=drive['id']))
+            page_token = None
+            while True:
+                response = self.service.drives().list(
+                    pageSize=100,
+                    pageToken=page_token,
+                    fields='nextPageToken, drives(id, name)'
+                ).execute()
+                for drive in response.get('drives', []):
+                    drives.append(DriveItem(id=drive['id']).populate(name=drive.get('name')))
+                
+                page_token = response.get('nextPageToken')
+                if not page_token:
+                    break
         except Exception:
             # If the user doesn't have access to Shared Drives API or no shared drives exist
             pass
@@ -124,7 +342,7 @@ class DriveClient:
         try:
             file_info = self.service.files().get(
                 fileId=item_id,
-                fields='id, name, createdTime, modifiedTime, mimeType, kind, capabilities, owners, appProperties, properties, exportLinks',
+                fields=f'{ITEM_FIELDS}, exportLinks',
                 supportsAllDrives=True
             ).execute()
             
@@ -136,105 +354,345 @@ class DriveClient:
         except Exception as e:
             raise ValueError(f"Failed to fetch file '{item_id}': {str(e)}") from e
 
-    def list_items(self, parent_id: str, limit: int = None) -> List[DriveItem]:
+    def _list_page(self, request_params: dict, page_token: Optional[str], page_size: int) -> dict:
+        """
+        Execute a single files().list request.
+        
+        Args:
+            request_params: Base parameters for files().list
+            page_token: Token of the page to fetch, or None for the first page
+            page_size: Number of files to request
+            
+        Returns:
+            files().list response dictionary
+        """
+        params = dict(request_params, pageSize=page_size)
+        if page_token:
+            params['pageToken'] = page_token
+        return self.service.files().list(**params).execute(http=self._http())
+    
+    def _paginate(self, request_params: dict, limit: Optional[int] = None) -> Iterator[List[dict]]:
+        """
+        Iterate over the pages of a files().list request.
+        
+        The next page is requested in a background thread as soon as a response
+        arrives, so its round-trip overlaps with processing of the current page.
+        
+        Args:
+            request_params: Base parameters for files().list (pageSize and pageToken are managed here)
+            limit: Optional maximum number of files to fetch. If None, fetches all pages.
+            
+        Yields:
+            Lists of file dictionaries, one per page
+        """
+        page_size = min(1000, limit) if limit is not None else 1000  # API max is 1000
+        response = self._list_page(request_params, None, page_size)
+        fetched = 0
+        future = None
+        
+        try:
+            while True:
+                items = response.get('files', [])
+                fetched += len(items)
+                
+                # Prefetch the next page unless we're done or the limit is reached
+                future = None
+                page_token = response.get('nextPageToken')
+                remaining = limit - fetched if limit is not None else 1000
+                if page_token and remaining > 0:
+                    future = self._prefetch_executor.submit(self._list_page, request_params, page_token, min(1000, remaining))
+                
+                yield items
+                
+                if future is None:
+                    return
+                response = future.result()
+        finally:
+            # Caller stopped early, drop the prefetch if it hasn't started
+            if future is not None:
+                future.cancel()
+    
+    def _list_file_infos(self, query: str, limit: Optional[int] = None, detailed: bool = True) -> List[dict]:
+        """
+        List the file info dictionaries of all files matching a Drive query across all drives.
+        
+        Args:
+            query: Drive search query (the files().list 'q' parameter)
+            limit: Optional maximum number of files to return. If None, returns all files.
+            detailed: If True, requests all fields used by DriveItem. If False, only LEAN_ITEM_FIELDS.
+            
+        Returns:
+            List of file info dictionaries from the Drive API
+        """
+        request_params = {
+            'q': query,
+            'fields': f"nextPageToken, files({ITEM_FIELDS if detailed else LEAN_ITEM_FIELDS})",
+            'supportsAllDrives': True,
+            'includeItemsFromAllDrives': True
+        }
+        
+        file_infos = []
+        for items in self._paginate(request_params, limit):
+            if limit is None:
+                file_infos.extend(items)
+            else:
+                # Never keep more than the limit, even if a page is larger than requested
+                file_infos.extend(islice(items, max(0, limit - len(file_infos))))
+        
+        return file_infos
+    
+    def _list_files(self, query: str, limit: Optional[int] = None, detailed: bool = True) -> List[DriveItem]:
+        """
+        List all files matching a Drive query across all drives.
+        
+        Args:
+            query: Drive search query (the files().list 'q' parameter)
+            limit: Optional maximum number of items to return. If None, returns all items.
+            detailed: If True, requests all fields used by DriveItem. If False, only LEAN_ITEM_FIELDS.
+            
+        Returns:
+            List of DriveItem objects
+        """
+        return DriveItem.from_api_batch(self._list_file_infos(query, limit, detailed))
+    
+    def list_items(self, parent_id: str, limit: int = None, detailed: bool = True) -> List[DriveItem]:
         """
         List all items in a directory with pagination support.
         
         Args:
             parent_id: The ID of the parent directory
             limit: Optional maximum number of items to return. If None, returns all items.
+            detailed: If False, only fetches id, name, type and modified time, leaving owner,
+                     permissions and properties unpopulated. Much smaller responses for large listings.
             
         Returns:
-            List of fully populated DriveItem objects
+            List of DriveItem objects (fully populated if detailed is True)
             
         Note:
             This method handles pagination automatically, fetching all pages until
-            no more results exist or the limit is reached.
-        """
-        drive_items = []
-        page_token = None
-        page_size = min(1000, limit) if limit else 1000  # API max is 1000
-        
-        while True:
-            # Build request parameters
-            request_params = {
-                'q': f"'{parent_id}' in parents and trashed=false",
-                'fields': 'nextPageToken, files(id, name, createdTime, modifiedTime, mimeType, kind, capabilities, owners, appProperties, properties)',
-                'supportsAllDrives': True,
-                'includeItemsFromAllDrives': True,
-                'pageSize': page_size
-            }
+            no more results exist or the limit is reached. Listings are cached for
+            cache_ttl seconds; call clear_cache() to force a refresh.
+        """
+        limit = limit or None
+        cache_key = ('items', parent_id, limit, detailed)
+        file_infos = self._cache_get(cache_key)
+        if file_infos is None:
+            generation = self._cache_generation
+            query = f"'{parent_id.translate(_ESCAPE_TABLE)}' in parents and trashed=false"
+            file_infos = self._list_file_infos(query, limit, detailed)
+            self._cache_put(cache_key, file_infos, generation)
+        
+        # Build fresh items so callers can't modify cached data
+        return DriveItem.from_api_batch(file_infos)
+    
+    def list_items_columnar(self, parent_id: str, limit: int = None) -> Dict[str, list]:
+        """
+        List all items in a directory as columns instead of DriveItem objects.
+        
+        Each field is collected into its own list, without allocating a DriveItem
+        per file, which keeps very large listings compact. The result can be passed
+        directly to column-oriented libraries, e.g. pyarrow.Table.from_pydict().
+        
+        Args:
+            parent_id: The ID of the parent directory
+            limit: Optional maximum number of items to return. If None, returns all items.
             
-            if page_token:
-                request_params['pageToken'] = page_token
+        Returns:
+            Dictionary of equal-length lists under 'id', 'name', 'mime_type',
+            'created_time', 'modified_time' (RFC 3339 strings), 'created_time_ns',
+            'modified_time_ns' (integer nanoseconds since the epoch, or None) and
+            'owner' (owner email, or None)
+        """
+        request_params = {
+            'q': f"'{parent_id.translate(_ESCAPE_TABLE)}' in parents and trashed=false",
+            'fields': 'nextPageToken, files(id, name, mimeType, createdTime, modifiedTime, owners(emailAddress))',
+            'supportsAllDrives': True,
+            'includeItemsFromAllDrives': True
+        }
+        limit = limit or None
+        
+        columns = {
+            'id': [], 'name': [], 'mime_type': [], 'created_time': [], 'modified_time': [],
+            'created_time_ns': [], 'modified_time_ns': [], 'owner': []
+        }
+        for items in self._paginate(request_params, limit):
+            if limit is not None:
+                items = items[:max(0, limit - len(columns['id']))]
+            columns['id'].extend([item_data['id'] for item_data in items])
+            columns['name'].extend([item_data.get('name') for item_data in items])
+            # MIME types and owners repeat across a listing, share one string per value
+            columns['mime_type'].extend([sys.intern(item_data.get('mimeType', '')) for item_data in items])
+            columns['created_time'].extend([item_data.get('createdTime') for item_data in items])
+            columns['modified_time'].extend([item_data.get('modifiedTime') for item_data in items])
+            # Numeric timestamps convert straight to timestamp[ns] / datetime64[ns] columns
+            columns['created_time_ns'].extend([_timestamp_ns(item_data.get('createdTime')) for item_data in items])
+            columns['modified_time_ns'].extend([_timestamp_ns(item_data.get('modifiedTime')) for item_data in items])
+            # Same rules as DriveItem.owner: None when there is no owner email
+            for item_data in items:
+                owners = item_data.get('owners')
+                owner = owners[0].get('emailAddress') if owners else None
+                columns['owner'].append(sys.intern(owner) if owner else None)
+        
+        return columns
+    
+    @staticmethod
+    def _build_q(base: str, folder_ids: List[str], chunk: int = MAX_PARENTS_PER_QUERY) -> List[str]:
+        """
+        Build queries restricting a base query to items in any of the given folders.
+        
+        Args:
+            base: Drive search query to restrict
+            folder_ids: IDs of the parent folders
+            chunk: Maximum number of folder IDs per query, keeps queries well below Drive's length limits
             
-            # Execute request
-            response = self.service.files().list(**request_params).execute()
-            items = response.get('files', [])
+        Returns:
+            List of queries, one per chunk of folder IDs
+        """
+        queries = []
+        for start in range(0, len(folder_ids), chunk):
+            escaped_folder_ids = [fid.translate(_ESCAPE_TABLE) for fid in folder_ids[start:start + chunk]]
+            folder_clauses = " or ".join([f"'{fid}' in parents" for fid in escaped_folder_ids])
+            queries.append(f"({base}) and ({folder_clauses})")
+        return queries
+    
+    def _list_subfolder_ids(self, folder_ids: List[str]) -> List[str]:
+        """
+        List the IDs of the direct subfolders of several folders.
+        
+        Subfolder lists are cached per parent folder, only folders without a
+        cached list are queried.
+        
+        Args:
+            folder_ids: IDs of the parent folders (one query per MAX_PARENTS_PER_QUERY of them)
             
-            # Process items
-            for item_data in items:
-                if limit and len(drive_items) >= limit:
-                    return drive_items
-                    
-                item = DriveItem(id=item_data['id'])
-                item.update_from_api(item_data)
-                drive_items.append(item)
-            
-            # Check for next page
-            page_token = response.get('nextPageToken')
-            if not page_token:
-                break
-                
-            # Adjust page size for next request if we're near the limit
-            if limit:
-                remaining = limit - len(drive_items)
-                if remaining <= 0:
-                    break
-                page_size = min(1000, remaining)
+        Returns:
+            List of subfolder IDs (folders that cannot be listed contribute none)
+        """
+        subfolder_ids = {}
+        uncached_ids = []
+        for folder_id in folder_ids:
+            cached = self._cache_get(('subfolders', folder_id))
+            if cached is None:
+                uncached_ids.append(folder_id)
+            else:
+                subfolder_ids[folder_id] = cached
         
-        return drive_items
+        if uncached_ids:
+            generation = self._cache_generation
+            children = {folder_id: [] for folder_id in uncached_ids}
+            try:
+                for query in self._build_q(f"mimeType = '{FOLDER_MIME_TYPE}' and trashed=false", uncached_ids):
+                    request_params = {
+                        'q': query,
+                        'fields': 'nextPageToken, files(id, parents)',
+                        'supportsAllDrives': True,
+                        'includeItemsFromAllDrives': True
+                    }
+                    for items in self._paginate(request_params):
+                        for item_data in items:
+                            if len(uncached_ids) == 1:
+                                # Single parent, possibly an alias such as 'root' that never appears in parents
+                                children[uncached_ids[0]].append(item_data['id'])
+                                continue
+                            for parent_id in item_data.get('parents', []):
+                                if parent_id in children:
+                                    children[parent_id].append(item_data['id'])
+            except Exception as e:
+                logger.warning(f"Failed to list subfolders of folders {uncached_ids}: {e}")
+            else:
+                for folder_id, child_ids in children.items():
+                    self._cache_put(('subfolders', folder_id), child_ids, generation)
+            subfolder_ids.update(children)
+        
+        return [subfolder_id for folder_id in folder_ids for subfolder_id in subfolder_ids[folder_id]]
     
-    def _collect_folder_ids_recursive(self, folder_id: str, visited: set = None) -> List[str]:
+    def _iter_folder_levels(self, folder_id: str) -> Iterator[List[str]]:
         """
-        Recursively collect all folder IDs under a given folder (including the folder itself).
+        Walk a folder tree breadth-first, level by level.
+        
+        Subfolders of a level are listed with one query per MAX_PARENTS_PER_QUERY
+        folders, and those queries run concurrently on the client's workers. The
+        walk is lazy: the next level is only listed once the caller asks for it.
         
         Args:
             folder_id: The root folder ID to start from
-            visited: Set of already visited folder IDs to prevent cycles
+            
+        Yields:
+            Lists of folder IDs, starting with [folder_id]
+        """
+        # Visited set prevents cycles and duplicates (e.g. folders with several parents)
+        visited = {folder_id}
+        level = [folder_id]
+        
+        while level:
+            yield level
+            
+            chunks = [level[i:i + MAX_PARENTS_PER_QUERY] for i in range(0, len(level), MAX_PARENTS_PER_QUERY)]
+            next_level = []
+            for subfolder_ids in self._executor.map(self._list_subfolder_ids, chunks):
+                for subfolder_id in subfolder_ids:
+                    if subfolder_id not in visited:
+                        visited.add(subfolder_id)
+                        next_level.append(subfolder_id)
+            level = next_level
+    
+    def _search(
+        self,
+        search_query: str,
+        limit: int,
+        folder_id: Optional[str] = None,
+        detailed: bool = True
+    ) -> List[DriveItem]:
+        """
+        Run a search query, optionally restricted to a folder and its subfolders.
+        
+        Folder-restricted searches walk the tree level by level. Each level is
+        queried in chunks of MAX_PARENTS_PER_QUERY folders, with the chunk queries
+        running concurrently, and the walk stops as soon as the limit is reached
+        instead of enumerating the whole tree up front.
+        
+        Args:
+            search_query: Drive search query
+            limit: Maximum number of results to return
+            folder_id: Optional folder ID to restrict the search to
+            detailed: If True, requests all fields used by DriveItem. If False, only LEAN_ITEM_FIELDS.
             
         Returns:
-            List of all folder IDs including the root folder and all subfolders
+            List of DriveItem objects matching the query
         """
-        if visited is None:
-            visited = set()
+        if not folder_id:
+            return self._list_files(search_query, limit, detailed)
         
-        # Prevent circular references
-        if folder_id in visited:
+        if limit <= 0:
             return []
         
-        visited.add(folder_id)
-        folder_ids = [folder_id]
-        
-        try:
-            # List all items in this folder
-            items = self.list_items(folder_id)
-            
-            # Recursively collect subfolder IDs
-            for item in items:
-                if item.type == ItemType.DIRECTORY:
-                    subfolder_ids = self._collect_folder_ids_recursive(item.id, visited)
-                    folder_ids.extend(subfolder_ids)
-        except Exception as e:
-            logger.warning(f"Failed to list items in folder {folder_id}: {e}")
+        file_infos = []
+        seen_ids = set()
+        for level in self._iter_folder_levels(folder_id):
+            remaining = limit - len(file_infos)
+            chunk_results = self._executor.map(
+                partial(self._list_file_infos, limit=remaining, detailed=detailed),
+                self._build_q(search_query, level)
+            )
+            
+            # Merge chunk results in order; items with several parents can match more than one chunk
+            for chunk_file_infos in chunk_results:
+                for item_data in chunk_file_infos:
+                    if item_data['id'] not in seen_ids and len(file_infos) < limit:
+                        seen_ids.add(item_data['id'])
+                        file_infos.append(item_data)
+            
+            if len(file_infos) >= limit:
+                break
         
-        return folder_ids
+        return DriveItem.from_api_batch(file_infos)
     
     def search_by_name(
         self,
         query: str,
         limit: int = 25,
-        folder_id: Optional[str] = None
+        folder_id: Optional[str] = None,
+        detailed: bool = True
     ) -> List[DriveItem]:
         """
         Search for files by name across all drives (My Drive + Shared Drives).
@@ -243,6 +701,7 @@ class DriveClient:
             query: Search query string to match against file names
             limit: Maximum number of results to return (default: 25)
             folder_id: Optional folder ID to restrict search to this folder and its subfolders
+            detailed: If False, only fetches id, name, type and modified time of each result
             
         Returns:
             List of DriveItem objects matching the search criteria
@@ -253,68 +712,15 @@ class DriveClient:
             >>> for item in results:
             ...     print(f"{item.name} ({item.id})")
         """
-        # Escape single quotes in query
-        escaped_query = query.replace("'", "\\'")
+        # Escape single quotes and backslashes in query
+        escaped_query = query.translate(_ESCAPE_TABLE)
         
         # Build base query
         search_query = f"name contains '{escaped_query}' and trashed=false"
         
-        # Add folder restriction if specified
-        if folder_id:
-            logger.info(f"Collecting folder IDs for recursive search under {folder_id}")
-            folder_ids = self._collect_folder_ids_recursive(folder_id)
-            logger.info(f"Found {len(folder_ids)} folders to search in")
-            
-            # Build OR clause for all folders
-            if folder_ids:
-                escaped_folder_ids = [fid.replace("'", "\\'") for fid in folder_ids]
-                folder_clauses = " or ".join([f"'{fid}' in parents" for fid in escaped_folder_ids])
-                search_query = f"({search_query}) and ({folder_clauses})"
-        
         logger.info(f"Searching by name: '{query}' (limit={limit})")
         
-        # Execute search with pagination
-        drive_items = []
-        page_token = None
-        page_size = min(1000, limit)
-        
-        while True:
-            # Build request parameters
-            request_params = {
-                'q': search_query,
-                'fields': 'nextPageToken, files(id, name, createdTime, modifiedTime, mimeType, kind, capabilities, owners, appProperties, properties)',
-                'supportsAllDrives': True,
-                'includeItemsFromAllDrives': True,
-                'pageSize': page_size
-            }
-            
-            if page_token:
-                request_params['pageToken'] = page_token
-            
-            # Execute request
-            response = self.service.files().list(**request_params).execute()
-            items = response.get('files', [])
-            
-            # Process items
-            for item_data in items:
-                if len(drive_items) >= limit:
-                    logger.info(f"Search by name returned {len(drive_items)} results")
-                    return drive_items
-                    
-                item = DriveItem(id=item_data['id'])
-                item.update_from_api(item_data)
-                drive_items.append(item)
-            
-            # Check for next page
-            page_token = response.get('nextPageToken')
-            if not page_token:
-                break
-                
-            # Adjust page size for next request if we're near the limit
-            remaining = limit - len(drive_items)
-            if remaining <= 0:
-                break
-            page_size = min(1000, remaining)
+        drive_items = self._search(search_query, limit, folder_id, detailed)
         
         logger.info(f"Search by name returned {len(drive_items)} results")
         return drive_items
@@ -323,7 +729,8 @@ class DriveClient:
         self,
         query: str,
         limit: int = 25,
-        folder_id: Optional[str] = None
+        folder_id: Optional[str] = None,
+        detailed: bool = True
     ) -> List[DriveItem]:
         """
         Search for files by full-text content across all drives (My Drive + Shared Drives).
@@ -332,6 +739,7 @@ class DriveClient:
             query: Search query string to match against file contents
             limit: Maximum number of results to return (default: 25)
             folder_id: Optional folder ID to restrict search to this folder and its subfolders
+            detailed: If False, only fetches id, name, type and modified time of each result
             
         Returns:
             List of DriveItem objects matching the search criteria
@@ -346,68 +754,15 @@ class DriveClient:
             >>> for item in results:
             ...     print(f"{item.name} ({item.id})")
         """
-        # Escape single quotes in query
-        escaped_query = query.replace("'", "\\'")
+        # Escape single quotes and backslashes in query
+        escaped_query = query.translate(_ESCAPE_TABLE)
         
         # Build base query
         search_query = f"fullText contains '{escaped_query}' and trashed=false"
         
-        # Add folder restriction if specified
-        if folder_id:
-            logger.info(f"Collecting folder IDs for recursive search under {folder_id}")
-            folder_ids = self._collect_folder_ids_recursive(folder_id)
-            logger.info(f"Found {len(folder_ids)} folders to search in")
-            
-            # Build OR clause for all folders
-            if folder_ids:
-                escaped_folder_ids = [fid.replace("'", "\\'") for fid in folder_ids]
-                folder_clauses = " or ".join([f"'{fid}' in parents" for fid in escaped_folder_ids])
-                search_query = f"({search_query}) and ({folder_clauses})"
-        
         logger.info(f"Searching by content: '{query}' (limit={limit})")
         
-        # Execute search with pagination
-        drive_items = []
-        page_token = None
-        page_size = min(1000, limit)
-        
-        while True:
-            # Build request parameters
-            request_params = {
-                'q': search_query,
-                'fields': 'nextPageToken, files(id, name, createdTime, modifiedTime, mimeType, kind, capabilities, owners, appProperties, properties)',
-                'supportsAllDrives': True,
-                'includeItemsFromAllDrives': True,
-                'pageSize': page_size
-            }
-            
-            if page_token:
-                request_params['pageToken'] = page_token
-            
-            # Execute request
-            response = self.service.files().list(**request_params).execute()
-            items = response.get('files', [])
-            
-            # Process items
-            for item_data in items:
-                if len(drive_items) >= limit:
-                    logger.info(f"Search by content returned {len(drive_items)} results")
-                    return drive_items
-                    
-                item = DriveItem(id=item_data['id'])
-                item.update_from_api(item_data)
-                drive_items.append(item)
-            
-            # Check for next page
-            page_token = response.get('nextPageToken')
-            if not page_token:
-                break
-                
-            # Adjust page size for next request if we're near the limit
-            remaining = limit - len(drive_items)
-            if remaining <= 0:
-                break
-            page_size = min(1000, remaining)
+        drive_items = self._search(search_query, limit, folder_id, detailed)
         
         logger.info(f"Search by content returned {len(drive_items)} results")
         return drive_items
@@ -423,7 +778,7 @@ class DriveClient:
         
         Args:
             item: The DriveItem to update
-            properties: Dictionary of properties to set
+            properties: Dictionary of properties to set (a None value deletes the property)
             global_props: If True, updates properties (global). If False, updates appProperties (app-specific)
             
         Returns:
@@ -433,36 +788,22 @@ class DriveClient:
             ValueError: If the update fails
         """
         try:
-            # Filter None values - those need to be explicitly deleted
-            props_to_set = {k: v for k, v in properties.items() if v is not None}
-            props_to_delete = [k for k, v in properties.items() if v is None]
-            
-            update_body = {}
+            # Drive deletes properties whose value is None, so sets and deletes share one update
             prop_key = 'properties' if global_props else 'appProperties'
+            update_body = {prop_key: dict(properties)}
             
-            # Set non-None properties
-            if props_to_set:
-                update_body[prop_key] = props_to_set
-            
-            self.service.files().update(
+            file_info = self.service.files().update(
                 fileId=item.id,
                 body=update_body,
-                fields='id',
+                fields=f'{ITEM_FIELDS}, exportLinks',
                 supportsAllDrives=True
             ).execute()
             
-            # Delete None properties separately
-            for prop in props_to_delete:
-                delete_body = {prop_key: {prop: None}}
-                self.service.files().update(
-                    fileId=item.id,
-                    body=delete_body,
-                    fields='id',
-                    supportsAllDrives=True
-                ).execute()
+            # Cached listings hold the old properties
+            self.clear_cache()
             
-            # Refresh and return updated item
-            return self.get_item(item.id)
+            # Refresh item from the update response
+            return item.update_from_api(file_info)
         except Exception as e:
             raise ValueError(f"Failed to update properties for file '{item.id}': {str(e)}") from e
 
@@ -493,31 +834,136 @@ class DriveClient:
         
         try:
             # Request file download
-            request = self.service.files().get_media(fileId=item.id, supportsAllDrives=True)
-            
-            # Download to memory buffer
-            file_buffer = io.BytesIO()
-            downloader = MediaIoBaseDownload(file_buffer, request)
-            
-            done = False
-            while not done:
-                status, done = downloader.next_chunk()
+            uri = self.service.files().get_media(fileId=item.id, supportsAllDrives=True).uri
             
-            # Get the binary data
-            file_buffer.seek(0)
-            binary_data = file_buffer.read()
-            
-            # Save to disk or return bytes
+            # Stream to a temp file next to the target (so an existing file survives a
+            # failed download), or download to memory buffer
             if filesystem_path:
-                with open(filesystem_path, 'wb') as f:
-                    f.write(binary_data)
-                return None
+                file_buffer = tempfile.NamedTemporaryFile(
+                    dir=os.path.dirname(os.path.abspath(filesystem_path)), delete=False
+                )
             else:
-                return binary_data
+                file_buffer = io.BytesIO()
+            try:
+                # The first part also tells us the total file size
+                response, content = self._download_range(uri, 0, DOWNLOAD_PART_SIZE - 1)
+                file_buffer.write(content)
+                
+                # Download the remaining parts concurrently
+                total_size = self._content_range_size(response)
+                if response.status == 206 and total_size is not None and total_size > len(content):
+                    starts = iter(range(len(content), total_size, DOWNLOAD_PART_SIZE))
+                    pending = {}
+                    try:
+                        while True:
+                            # Keep at most MAX_WORKERS parts in flight, so unwritten parts
+                            # held in memory stay bounded regardless of file size
+                            for start in islice(starts, MAX_WORKERS - len(pending)):
+                                end = min(start + DOWNLOAD_PART_SIZE, total_size) - 1
+                                pending[self._executor.submit(self._download_range, uri, start, end)] = start
+                            if not pending:
+                                break
+                            done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                            while done:
+                                # Popping drops our references to the part once it is written
+                                future = done.pop()
+                                start = pending.pop(future)
+                                response, content = future.result()
+                                if response.status != 206:
+                                    raise ValueError(f"Unexpected HTTP status {response.status} for a byte range request")
+                                file_buffer.seek(start)
+                                file_buffer.write(content)
+                            future = response = content = None
+                    finally:
+                        # Don't start the remaining parts if one failed
+                        for future in pending:
+                            future.cancel()
+                
+                # File saved to disk or return bytes
+                if filesystem_path:
+                    file_buffer.close()
+                    os.replace(file_buffer.name, filesystem_path)
+                    return None
+                else:
+                    return file_buffer.getvalue()
+            except BaseException:
+                # Don't leave a partially written temp file behind
+                if filesystem_path:
+                    file_buffer.close()
+                    os.remove(file_buffer.name)
+                raise
+            finally:
+                file_buffer.close()
                 
         except Exception as e:
             raise ValueError(f"Failed to download file '{item.id}': {str(e)}") from e
 
+    def _download_range(self, uri: str, start: int, end: int) -> tuple:
+        """
+        Download a byte range of a file's contents.
+        
+        Args:
+            uri: Media download URI of the file
+            start: First byte offset (inclusive)
+            end: Last byte offset (inclusive)
+            
+        Returns:
+            Tuple of (httplib2 response, content bytes)
+            
+        Raises:
+            HttpError: If the request fails
+        """
+        response, content = self._http().request(uri, headers={'Range': f'bytes={start}-{end}'})
+        if response.status == 416:
+            # Range not satisfiable: the file is empty
+            return response, b''
+        if response.status not in (200, 206):
+            raise HttpError(response, content, uri=uri)
+        return response, content
+    
+    def _content_range_size(self, response) -> Optional[int]:
+        """Get the total file size from a Content-Range response header, if known."""
+        total_size = response.get('content-range', '').rpartition('/')[2]
+        return int(total_size) if total_size.isdigit() else None
+
+    def _format_comments(self, comments: List[dict]) -> List[dict]:
+        """
+        Format comments and replies from the Drive API.
+        
+        Args:
+            comments: Comment dictionaries from comments().list
+            
+        Returns:
+            List of comment dictionaries with formatted timestamps
+        """
+        formatted_comments = []
+        for comment in comments:
+            author_obj = comment.get('author', {})
+            formatted_comment = {
+                'id': comment['id'],
+                'author': author_obj.get('displayName', 'Unknown'),
+                'author_email': author_obj.get('emailAddress', ''),
+                'content': comment.get('content', ''),
+                'snippet': comment.get('quotedFileContent', {}).get('value', ''),
+                'createdTime': _format_timestamp(comment['createdTime']),
+                'modifiedTime': _format_timestamp(comment['modifiedTime']),
+                'resolved': comment.get('resolved', False),
+                'anchor': comment.get('anchor', ''),
+                'replies': []
+            }
+            for reply in comment.get('replies', []):
+                reply_author_obj = reply.get('author', {})
+                formatted_comment['replies'].append({
+                    'id': reply['id'],
+                    'author': reply_author_obj.get('displayName', 'Unknown'),
+                    'author_email': reply_author_obj.get('emailAddress', ''),
+                    'content': reply.get('content', ''),
+                    'createdTime': _format_timestamp(reply['createdTime']),
+                    'modifiedTime': _format_timestamp(reply['modifiedTime']),
+                })
+            formatted_comments.append(formatted_comment)
+        return formatted_comments
+
     def get_comments(self, file_id: str) -> List[dict]:
         """
         Get all comments for a file.
@@ -535,7 +981,7 @@ class DriveClient:
             while True:
                 response = self.service.comments().list(
                     fileId=file_id,
-                    fields='nextPageToken, comments(id, content, author(displayName, emailAddress), createdTime, modifiedTime, quotedFileContent, replies(id, content, author(displayName, emailAddress), createdTime, modifiedTime), resolved, anchor)',
+                    fields=COMMENT_FIELDS,
                     pageToken=page_token,
                     includeDeleted=False
                 ).execute()
@@ -548,45 +994,94 @@ class DriveClient:
             
             logger.info(f"Retrieved {len(comments)} comments for file {file_id}")
             
-            # Format comments and replies
-            formatted_comments = []
-            for comment in comments:
-                # Format the comment time to be YYYY-MM-DD HH:MM
-                created_dt = datetime.fromisoformat(comment['createdTime'].replace('Z', '+00:00'))
-                modified_dt = datetime.fromisoformat(comment['modifiedTime'].replace('Z', '+00:00'))
-                author_obj = comment.get('author', {})
-                formatted_comment = {
-                    'id': comment['id'],
-                    'author': author_obj.get('displayName', 'Unknown'),
-                    'author_email': author_obj.get('emailAddress', ''),
-                    'content': comment.get('content', ''),
-                    'snippet': comment.get('quotedFileContent', {}).get('value', ''),
-                    'createdTime': created_dt.strftime('%Y-%m-%d %H:%M'),
-                    'modifiedTime': modified_dt.strftime('%Y-%m-%d %H:%M'),
-                    'resolved': comment.get('resolved', False),
-                    'anchor': comment.get('anchor', ''),
-                    'replies': []
-                }
-                for reply in comment.get('replies', []):
-                    # Format these to be YYYY-MM-DD HH:MM
-                    reply_created_dt = datetime.fromisoformat(reply['createdTime'].replace('Z', '+00:00'))
-                    reply_modified_dt = datetime.fromisoformat(reply['modifiedTime'].replace('Z', '+00:00'))
-                    reply_author_obj = reply.get('author', {})
-                    formatted_comment['replies'].append({
-                        'id': reply['id'],
-                        'author': reply_author_obj.get('displayName', 'Unknown'),
-                        'author_email': reply_author_obj.get('emailAddress', ''),
-                        'content': reply.get('content', ''),
-                        'createdTime': reply_created_dt.strftime('%Y-%m-%d %H:%M'), 
-                        'modifiedTime': reply_modified_dt.strftime('%Y-%m-%d %H:%M'),
-                    })
-                formatted_comments.append(formatted_comment)
-            return formatted_comments
+            return self._format_comments(comments)
         except Exception as e:
             logger.error(f"Error getting comments for file {file_id}: {e}")
             # Return empty list if comments API fails (some files don't support comments)
             return []
 
+    def get_comments_bulk(self, file_ids: List[str]) -> Dict[str, List[dict]]:
+        """
+        Get all comments for several files using batch requests.
+        
+        Each round sends one comments().list page request per file, packed into
+        batches of up to MAX_BATCH_SIZE requests, and the next round only covers
+        files with more pages. Rate-limited requests are retried in the next round
+        after an exponential backoff, up to MAX_RATE_LIMIT_RETRIES times per file.
+        
+        Args:
+            file_ids: The file IDs
+            
+        Returns:
+            Dictionary mapping each file ID to its list of comment dictionaries,
+            formatted as in get_comments(). Files whose comments can't be fetched (or are
+            still rate limited after all retries) map to [].
+            
+        Raises:
+            ValueError: If a batch request fails
+        """
+        comments = {file_id: [] for file_id in file_ids}
+        failed_ids = set()
+        retries = {}
+        pending = [(file_id, None) for file_id in comments]
+        
+        try:
+            while pending:
+                next_pending = []
+                page_tokens = dict(pending)
+                rate_limited = []
+                
+                def on_response(file_id, response, exception):
+                    if exception is not None:
+                        if _is_rate_limited(exception) and retries.get(file_id, 0) < MAX_RATE_LIMIT_RETRIES:
+                            # Ask for the same page again in the next round
+                            retries[file_id] = retries.get(file_id, 0) + 1
+                            rate_limited.append(file_id)
+                            next_pending.append((file_id, page_tokens[file_id]))
+                            return
+                        logger.error(f"Error getting comments for file {file_id}: {exception}")
+                        failed_ids.add(file_id)
+                        return
+                    comments[file_id].extend(response.get('comments', []))
+                    if response.get('nextPageToken'):
+                        next_pending.append((file_id, response['nextPageToken']))
+                
+                for start in range(0, len(pending), MAX_BATCH_SIZE):
+                    batch = self.service.new_batch_http_request(callback=on_response)
+                    for file_id, page_token in pending[start:start + MAX_BATCH_SIZE]:
+                        batch.add(self.service.comments().list(
+                            fileId=file_id,
+                            fields=COMMENT_FIELDS,
+                            pageToken=page_token,
+                            includeDeleted=False
+                        ), request_id=file_id)
+                    batch.execute()
+                
+                if rate_limited:
+                    attempt = max(retries[file_id] for file_id in rate_limited)
+                    delay = RATE_LIMIT_BACKOFF * 2 ** (attempt - 1) + random.uniform(0, RATE_LIMIT_BACKOFF)
+                    logger.warning(f"{len(rate_limited)} comment requests rate limited, retrying in {delay:.1f}s")
+                    time.sleep(delay)
+                
+                pending = next_pending
+        except Exception as e:
+            raise ValueError(f"Failed to get comments for files {list(comments)}: {str(e)}") from e
+        
+        logger.info(f"Retrieved {sum(len(c) for c in comments.values())} comments for {len(comments)} files")
+        
+        formatted = {}
+        for file_id, file_comments in comments.items():
+            if file_id in failed_ids:
+                formatted[file_id] = []
+                continue
+            try:
+                formatted[file_id] = self._format_comments(file_comments)
+            except Exception as e:
+                # Same as get_comments(): a malformed comment only empties its own file
+                logger.error(f"Error getting comments for file {file_id}: {e}")
+                formatted[file_id] = []
+        return formatted
+
     def reply_to_comment(self, file_id: str, comment_id: str, content: str) -> dict:
         """
         Reply to a comment.
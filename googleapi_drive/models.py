@@ -3,6 +3,22 @@
 from __future__ import annotations
 from dataclasses import dataclass
 from enum import Enum
+from functools import lru_cache
+from types import MappingProxyType
+import json
+import sys
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def _fast_deep_copy(d: dict) -> dict:
+    """Deep copy a JSON-compatible dict via a serialization round-trip (orjson when installed)."""
+    if orjson is not None:
+        return orjson.loads(orjson.dumps(d))
+    return json.loads(json.dumps(d))
 
 
 class ItemType(str, Enum):
@@ -14,21 +30,48 @@ class ItemType(str, Enum):
     DOCS_SHEETS = "docs_sheets"
 
 
+# Serialized value of each ItemType (and of an unset type), avoids Enum.value per call
+_ITEM_TYPE_VALUES = {m: m.value for m in ItemType}
+_ITEM_TYPE_VALUES[None] = None
+
+# Reverse of _ITEM_TYPE_VALUES, a plain dict is faster than ItemType(value)
+_ITEM_TYPE_BY_VALUE = {m.value: m for m in ItemType}
+
+
+def item_type_from_value(value: str) -> ItemType:
+    """
+    Convert a serialized ItemType value (as produced by DriveItem.to_dict) back to ItemType.
+    
+    Args:
+        value: ItemType value, e.g. "directory"
+        
+    Returns:
+        Matching ItemType
+        
+    Raises:
+        ValueError: If value is not a valid ItemType value
+    """
+    try:
+        return _ITEM_TYPE_BY_VALUE[value]
+    except KeyError:
+        raise ValueError(f"{value!r} is not a valid ItemType") from None
+
+
+_MIME_TO_ITEM_TYPE = {
+    'application/vnd.google-apps.folder': ItemType.DIRECTORY,
+    'application/vnd.google-apps.document': ItemType.DOCS_DOCUMENT,
+    'application/vnd.google-apps.presentation': ItemType.DOCS_SLIDES,
+    'application/vnd.google-apps.spreadsheet': ItemType.DOCS_SHEETS,
+}
+
+
+@lru_cache(maxsize=128)
 def item_type_from_mime_type(mime_type: str) -> ItemType:
     """Convert Google Drive MIME type to ItemType enum."""
-    if mime_type == 'application/vnd.google-apps.folder':
-        return ItemType.DIRECTORY
-    elif mime_type == 'application/vnd.google-apps.document':
-        return ItemType.DOCS_DOCUMENT
-    elif mime_type == 'application/vnd.google-apps.presentation':
-        return ItemType.DOCS_SLIDES
-    elif mime_type == 'application/vnd.google-apps.spreadsheet':
-        return ItemType.DOCS_SHEETS
-    else:
-        return ItemType.RAW_FILE
-
-
-@dataclass
+    return _MIME_TO_ITEM_TYPE.get(mime_type, ItemType.RAW_FILE)
+
+
+@dataclass(slots=True, frozen=True)
 class DriveItemPermission:
     """User permissions for a Drive item."""
     can_edit: bool
@@ -36,8 +79,47 @@ class DriveItemPermission:
     can_view: bool
 
 
+# Permissions are immutable and only have 8 possible values, so all items share these
+_PERMISSION_CACHE = {
+    (can_edit, can_comment, can_view): DriveItemPermission(can_edit, can_comment, can_view)
+    for can_edit in (False, True)
+    for can_comment in (False, True)
+    for can_view in (False, True)
+}
+
+# Permission tuples as stored on items, keyed like _PERMISSION_CACHE
+_PERMISSION_TUPLES = {key: (p,) for key, p in _PERMISSION_CACHE.items()}
+
+# Serialized form of each interned permission, shared by to_dict()
+_PERMISSION_DICTS = {
+    p: {'can_edit': p.can_edit, 'can_comment': p.can_comment, 'can_view': p.can_view}
+    for p in _PERMISSION_CACHE.values()
+}
+
+
+def _permission_to_dict(p: DriveItemPermission) -> dict:
+    """Return the shared dict form of a permission, building one for non-boolean values."""
+    d = _PERMISSION_DICTS.get(p)
+    if d is None:
+        d = {'can_edit': p.can_edit, 'can_comment': p.can_comment, 'can_view': p.can_view}
+    return d
+
+# Read-only empty mapping returned for unset property dicts, avoids a throwaway dict per call
+_EMPTY = MappingProxyType({})
+
+
 class DriveItem:
-    """Represents a Google Drive item (file, folder, or Google Workspace document)."""
+    """
+    Represents a Google Drive item (file, folder, or Google Workspace document).
+
+    Collection accessors return read-only views (tuples and MappingProxyType) that share
+    the item's storage instead of copying it. Use list()/dict() on them to get a mutable copy.
+    """
+    
+    __slots__ = (
+        '_id', '_name', '_created_time', '_modified_time', '_owner', '_type',
+        '_properties', '_app_properties', '_permissions', '_children_ids', '_export_links'
+    )
     
     def __init__(self, id: str):
         self._id = id
@@ -46,12 +128,25 @@ class DriveItem:
         self._modified_time = None
         self._owner = None
         self._type = None
-        self._properties = {}
-        self._app_properties = {}
-        self._permissions = []
-        self._children_ids = []
+        # Unset collections are None or the shared empty tuple, so new items allocate nothing
+        self._properties = None
+        self._app_properties = None
+        self._permissions = ()
+        self._children_ids = ()
         self._export_links = None
     
+    def __eq__(self, other: object) -> bool:
+        # Drive IDs are unique, so items are equal when they refer to the same file
+        if not isinstance(other, DriveItem):
+            return NotImplemented
+        return self._id == other._id
+    
+    def __hash__(self) -> int:
+        return hash(self._id)
+    
+    def __repr__(self) -> str:
+        return f"DriveItem(id={self._id!r}, name={self._name!r}, type={self._type})"
+    
     @property
     def id(self) -> str:
         return self._id
@@ -77,16 +172,16 @@ class DriveItem:
         return self._type
     
     @property
-    def permissions(self) -> list[DriveItemPermission]:
-        return self._permissions.copy()
+    def permissions(self) -> tuple[DriveItemPermission, ...]:
+        return self._permissions
     
     @property
-    def children_ids(self) -> list[str]:
-        return self._children_ids.copy()
+    def children_ids(self) -> tuple[str, ...]:
+        return self._children_ids
     
     @property
-    def export_links(self) -> dict[str, str] | None:
-        return self._export_links.copy() if self._export_links else None
+    def export_links(self) -> MappingProxyType[str, str] | None:
+        return MappingProxyType(self._export_links) if self._export_links else None
     
     def populate(
         self,
@@ -134,17 +229,17 @@ class DriveItem:
         if app_properties is not None:
             self._app_properties = app_properties
         if permissions is not None:
-            self._permissions = permissions
+            self._permissions = tuple(permissions)
         if children_ids is not None:
             if self._type is not None and self._type != ItemType.DIRECTORY:
                 raise ValueError("children_ids can only be set for DIRECTORY items")
-            self._children_ids = children_ids
+            self._children_ids = tuple(children_ids)
         if export_links is not None:
             self._export_links = export_links
         
         return self
     
-    def get_properties(self, global_props: bool = False) -> dict[str, str]:
+    def get_properties(self, global_props: bool = False) -> MappingProxyType[str, str]:
         """
         Get file properties.
         
@@ -152,9 +247,10 @@ class DriveItem:
             global_props: If True, returns properties (global). If False, returns appProperties (app-specific)
             
         Returns:
-            Dictionary of properties or appProperties
+            Read-only view of properties or appProperties
         """
-        return self._properties.copy() if global_props else self._app_properties.copy()
+        props = self._properties if global_props else self._app_properties
+        return MappingProxyType(props) if props is not None else _EMPTY
     
     def update_from_api(self, file_info: dict) -> 'DriveItem':
         """
@@ -169,38 +265,120 @@ class DriveItem:
         self._name = file_info.get('name')
         self._created_time = file_info.get('createdTime')
         self._modified_time = file_info.get('modifiedTime')
-        self._owner = file_info.get('owners', [{}])[0].get('emailAddress') if file_info.get('owners') else None
+        owners = file_info.get('owners')
+        owner = owners[0].get('emailAddress') if owners else None
+        # Owners repeat across a listing, share one string per email
+        self._owner = sys.intern(owner) if owner else None
         self._type = item_type_from_mime_type(file_info.get('mimeType', ''))
-        self._properties = file_info.get('properties', {})
-        self._app_properties = file_info.get('appProperties', {})
-        self._permissions = [DriveItemPermission(
-            can_edit=file_info.get('capabilities', {}).get('canEdit', False),
-            can_comment=file_info.get('capabilities', {}).get('canComment', False),
-            can_view=file_info.get('capabilities', {}).get('canView', True)
-        )]
+        self._properties = file_info.get('properties')
+        self._app_properties = file_info.get('appProperties')
+        # Leave permissions empty when capabilities weren't requested (lean listings)
+        caps = file_info.get('capabilities')
+        self._permissions = _PERMISSION_TUPLES[(
+            bool(caps.get('canEdit', False)),
+            bool(caps.get('canComment', False)),
+            bool(caps.get('canView', True))
+        )] if caps is not None else ()
         self._export_links = file_info.get('exportLinks')
         return self
     
-    def to_dict(self) -> dict:
-        """Convert DriveItem to dictionary."""
+    @classmethod
+    def from_api_batch(cls, file_infos: list[dict]) -> list['DriveItem']:
+        """
+        Build DriveItems from a list of Google Drive API file info dictionaries.
+        
+        Equivalent to DriveItem(info['id']).update_from_api(info) for each entry, but
+        with lookups hoisted out of the loop, which is faster for large listings.
+        
+        Args:
+            file_infos: Dictionaries from Google Drive API files().list()
+            
+        Returns:
+            List of DriveItem objects, in the same order
+        """
+        new = cls.__new__
+        intern = sys.intern
+        mime_types = _MIME_TO_ITEM_TYPE
+        raw_file = ItemType.RAW_FILE
+        permission_tuples = _PERMISSION_TUPLES
+        items = []
+        append = items.append
+        for info in file_infos:
+            get = info.get
+            item = new(cls)
+            item._id = info['id']
+            item._name = get('name')
+            item._created_time = get('createdTime')
+            item._modified_time = get('modifiedTime')
+            owners = get('owners')
+            owner = owners[0].get('emailAddress') if owners else None
+            item._owner = intern(owner) if owner else None
+            item._type = mime_types.get(get('mimeType'), raw_file)
+            item._properties = get('properties')
+            item._app_properties = get('appProperties')
+            caps = get('capabilities')
+            item._permissions = permission_tuples[(
+                bool(caps.get('canEdit', False)),
+                bool(caps.get('canComment', False)),
+                bool(caps.get('canView', True))
+            )] if caps is not None else ()
+            item._children_ids = ()
+            item._export_links = get('exportLinks')
+            append(item)
+        return items
+    
+    def to_dict(self, copy: bool = True, deep: bool = False) -> dict:
+        """
+        Convert DriveItem to dictionary.
+        
+        Args:
+            copy: If True, nested dicts are shallow copies. If False, they are the item's
+                  own storage, which is faster when the result is only read (e.g. passed to
+                  json.dumps) but must not be mutated
+            deep: If True, returns a fully independent deep copy, made with a JSON round-trip
+                  (orjson when installed) rather than copy.deepcopy. Use this before mutating
+                  nested values such as property dicts. Overrides copy
+            
+        Returns:
+            Dictionary representation of the item
+        """
+        if deep:
+            return _fast_deep_copy(self.to_dict(copy=False))
+        properties = self._properties
+        app_properties = self._app_properties
+        export_links = self._export_links
+        permissions = [_permission_to_dict(p) for p in self._permissions]
+        if copy:
+            permissions = [d.copy() for d in permissions]
+            properties = properties.copy() if properties is not None else None
+            app_properties = app_properties.copy() if app_properties is not None else None
+            export_links = export_links.copy() if export_links else None
         return {
             'id': self._id,
             'name': self._name,
             'created_time': self._created_time,
             'modified_time': self._modified_time,
             'owner': self._owner,
-            'type': self._type.value if self._type else None,
-            'properties': self._properties.copy(),
-            'app_properties': self._app_properties.copy(),
-            'permissions': [
-                {
-                    'can_edit': p.can_edit,
-                    'can_comment': p.can_comment,
-                    'can_view': p.can_view
-                }
-                for p in self._permissions
-            ],
-            'children_ids': self._children_ids.copy() if self._children_ids is not None else None,
-            'export_links': self._export_links.copy() if self._export_links else None
+            'type': _ITEM_TYPE_VALUES[self._type],
+            'properties': properties if properties is not None else {},
+            'app_properties': app_properties if app_properties is not None else {},
+            'permissions': permissions,
+            'children_ids': list(self._children_ids),
+            'export_links': export_links or None
         }
-
+    
+    def to_json_bytes(self) -> bytes:
+        """
+        Serialize DriveItem to JSON.
+        
+        Uses orjson when installed, falling back to the standard json module.
+        
+        Returns:
+            UTF-8 encoded JSON of the to_dict() representation
+        """
+        # Serialization does not mutate, so the uncopied dict is safe here
+        data = self.to_dict(copy=False)
+        if orjson is not None:
+            return orjson.dumps(data)
+        # Match orjson's output: compact separators, UTF-8 rather than ASCII escapes
+        return json.dumps(data, separators=(',', ':'), ensure_ascii=False).encode()